@@ -5,37 +5,38 @@ Analyzes installed applications for installation time, last usage, and storage s
 """
 
 import argparse
+import ctypes
+import ctypes.util
+import errno
+import functools
+import heapq
+import os
 import plistlib
+import struct
 import subprocess
-from datetime import datetime
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 
 def format_bytes(bytes_size):
     """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f'{bytes_size:.2f} {unit}'
-        bytes_size /= 1024.0
-    return f'{bytes_size:.2f} PB'
+    if bytes_size < 1024:
+        return f'{bytes_size:.2f} B'
+    # Each unit is 10 bits wide, so the bit length picks the unit directly
+    unit = min((int(bytes_size).bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f'{bytes_size / (1 << (10 * unit)):.2f} {BYTE_UNITS[unit]}'
 
 
 def get_directory_size(path):
     """Calculate total size of a directory."""
-    total = 0
-    try:
-        for item in path.rglob('*'):
-            try:
-                if item.is_file():
-                    total += item.stat().st_size
-            except (OSError, PermissionError):
-                continue
-    except (OSError, PermissionError):
-        pass
-    return total
-
+    # Canonicalize so symlinked aliases of the same folder share one cache entry
+    return _get_directory_size_cached(os.path.realpath(path))
 
-import sys
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -46,6 +47,16 @@ try:
 except ImportError:
     HAS_CHROME_ANALYZER = False
 
+try:
+    from Foundation import NSDictionary
+
+    HAS_FOUNDATION = True
+except ImportError:
+    HAS_FOUNDATION = False
+
+
+# Directory sizing is I/O-bound, so use more threads than cores
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 # Mapping for apps with special folder names
 APP_FOLDER_MAPPING = {
@@ -57,6 +68,189 @@ APP_FOLDER_MAPPING = {
 }
 
 
+@dataclass(slots=True)
+class AppInfo:
+    """Storage and usage information for a single application."""
+
+    name: str
+    path: str
+    size: int = 0
+    data_size: int = 0
+    cache_size: int = 0
+    created: datetime | None = None
+    modified: datetime | None = None
+    last_opened: datetime | None = None
+    bundle_id: str = 'Unknown'
+    version: str = 'Unknown'
+    bundle_name: str | None = None
+
+
+# Resolve user library locations once instead of per app
+_HOME = Path.home()
+_APP_SUPPORT = _HOME / 'Library/Application Support'
+_CACHES = _HOME / 'Library/Caches'
+
+# APP_FOLDER_MAPPING with folder names already joined to their base paths
+APP_FOLDER_MAPPING_PATHS = {
+    app_name: (
+        [_APP_SUPPORT / folder_name for folder_name in folders.get('data', [])],
+        [_CACHES / folder_name for folder_name in folders.get('cache', [])],
+    )
+    for app_name, folders in APP_FOLDER_MAPPING.items()
+}
+
+
+# getattrlistbulk(2) constants from <sys/attr.h> and <sys/vnode.h>
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_DATALENGTH = 0x00000200
+VREG = 1
+VDIR = 2
+BULK_ATTR_BUFFER_SIZE = 256 * 1024
+
+
+class _AttrList(ctypes.Structure):
+    """struct attrlist from <sys/attr.h>."""
+
+    _fields_ = [
+        ('bitmapcount', ctypes.c_ushort),
+        ('reserved', ctypes.c_uint16),
+        ('commonattr', ctypes.c_uint32),
+        ('volattr', ctypes.c_uint32),
+        ('dirattr', ctypes.c_uint32),
+        ('fileattr', ctypes.c_uint32),
+        ('forkattr', ctypes.c_uint32),
+    ]
+
+
+@functools.cache
+def _load_getattrlistbulk():
+    """Return libc's getattrlistbulk, or None when not running on macOS."""
+    if sys.platform != 'darwin':
+        return None
+
+    try:
+        func = ctypes.CDLL(None, use_errno=True).getattrlistbulk
+    except (OSError, AttributeError):
+        return None
+
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.c_uint64,
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+def _get_directory_size_bulk(path, getattrlistbulk):
+    """Sum file sizes using getattrlistbulk, which returns many entries per syscall."""
+    attr_list = _AttrList(
+        bitmapcount=ATTR_BIT_MAP_COUNT,
+        commonattr=ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_ERROR | ATTR_CMN_NAME | ATTR_CMN_OBJTYPE,
+        fileattr=ATTR_FILE_DATALENGTH,
+    )
+    buf = ctypes.create_string_buffer(BULK_ATTR_BUFFER_SIZE)
+    total = 0
+    stack = [path]
+
+    while stack:
+        current = stack.pop()
+        try:
+            fd = os.open(current, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            continue
+
+        # Entries are only committed once the whole directory has been read, so a
+        # failed call can hand the directory to the scandir walk without double counting
+        dir_total = 0
+        subdirs = []
+        try:
+            while True:
+                count = getattrlistbulk(fd, ctypes.byref(attr_list), buf, len(buf), 0)
+                if count == 0:
+                    total += dir_total
+                    stack.extend(subdirs)
+                    break
+                if count < 0:
+                    if ctypes.get_errno() == errno.EINTR:
+                        continue
+                    total += _get_directory_size_scandir(current)
+                    break
+
+                offset = 0
+                for _ in range(count):
+                    # Each entry: length, returned attribute_set_t, then the
+                    # returned attributes in request order
+                    (length,) = struct.unpack_from('=I', buf, offset)
+                    common, _, _, file_attrs, _ = struct.unpack_from('=5I', buf, offset + 4)
+                    field = offset + 24
+
+                    error = 0
+                    if common & ATTR_CMN_ERROR:
+                        (error,) = struct.unpack_from('=I', buf, field)
+                        field += 4
+
+                    name = None
+                    if common & ATTR_CMN_NAME:
+                        name_offset, name_length = struct.unpack_from('=iI', buf, field)
+                        name_start = field + name_offset
+                        name = buf[name_start : name_start + name_length - 1]
+                        field += 8
+
+                    obj_type = None
+                    if common & ATTR_CMN_OBJTYPE:
+                        (obj_type,) = struct.unpack_from('=I', buf, field)
+                        field += 4
+
+                    if not error:
+                        if obj_type == VDIR and name:
+                            subdirs.append(os.path.join(current, os.fsdecode(name)))
+                        elif obj_type == VREG and file_attrs & ATTR_FILE_DATALENGTH:
+                            dir_total += struct.unpack_from('=q', buf, field)[0]
+
+                    offset += length
+        finally:
+            os.close(fd)
+
+    return total
+
+
+def _get_directory_size_scandir(path):
+    """Sum file sizes under path with an explicit os.scandir stack."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except (OSError, PermissionError):
+                        continue
+        except (OSError, PermissionError):
+            continue
+    return total
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_directory_size_cached(path):
+    """Walk a directory and sum file sizes, memoized per resolved path."""
+    getattrlistbulk = _load_getattrlistbulk()
+    if getattrlistbulk is not None:
+        return _get_directory_size_bulk(path, getattrlistbulk)
+    return _get_directory_size_scandir(path)
+
+
+@functools.lru_cache(maxsize=1024)
 def get_app_info_from_plist(app_path):
     """Extract app information from Info.plist."""
     info = {}
@@ -64,133 +258,227 @@ def get_app_info_from_plist(app_path):
 
     try:
         if plist_path.exists():
-            with open(plist_path, 'rb') as f:
-                plist_data = plistlib.load(f)
-                info['bundle_id'] = plist_data.get('CFBundleIdentifier', 'Unknown')
-                info['version'] = plist_data.get('CFBundleShortVersionString', 'Unknown')
-                info['bundle_name'] = plist_data.get('CFBundleName', app_path.stem)
+            if HAS_FOUNDATION:
+                # Native parser, much faster than plistlib on binary plists
+                plist_data = NSDictionary.dictionaryWithContentsOfFile_(str(plist_path))
+            else:
+                with open(plist_path, 'rb') as f:
+                    plist_data = plistlib.load(f)
+
+            if plist_data is not None:
+                info['bundle_id'] = str(plist_data.get('CFBundleIdentifier', 'Unknown'))
+                info['version'] = str(plist_data.get('CFBundleShortVersionString', 'Unknown'))
+                info['bundle_name'] = str(plist_data.get('CFBundleName', app_path.stem))
     except Exception:
         pass
 
     return info
 
 
-def get_app_last_opened(app_path):
-    """Get last opened date for an application using multiple methods."""
-    last_opened = None
-    app_name = app_path.stem
+# Epoch used by CFAbsoluteTime (seconds since 2001-01-01 00:00:00 UTC)
+CF_ABSOLUTE_TIME_EPOCH = datetime(2001, 1, 1)
+CF_STRING_ENCODING_UTF8 = 0x08000100
+
+
+def _load_metadata_api():
+    """Load the Spotlight MDItem API from CoreServices, or None if unavailable."""
+    if sys.platform != 'darwin':
+        return None
+
+    cf_path = ctypes.util.find_library('CoreFoundation')
+    cs_path = ctypes.util.find_library('CoreServices')
+    if not cf_path or not cs_path:
+        return None
 
-    # Method 1: Check kMDItemLastUsedDate metadata
     try:
-        cmd = ['mdls', '-name', 'kMDItemLastUsedDate', '-raw', str(app_path)]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-        if result.returncode == 0 and result.stdout.strip() and result.stdout.strip() != '(null)':
-            date_str = result.stdout.strip().replace(' +0000', '')
+        cf = ctypes.CDLL(cf_path)
+        cs = ctypes.CDLL(cs_path)
+
+        cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFGetTypeID.argtypes = [ctypes.c_void_p]
+        cf.CFGetTypeID.restype = ctypes.c_ulong
+        cf.CFDateGetTypeID.argtypes = []
+        cf.CFDateGetTypeID.restype = ctypes.c_ulong
+        cf.CFDateGetAbsoluteTime.argtypes = [ctypes.c_void_p]
+        cf.CFDateGetAbsoluteTime.restype = ctypes.c_double
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        cf.CFRelease.restype = None
+
+        cs.MDItemCreate.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        cs.MDItemCreate.restype = ctypes.c_void_p
+        cs.MDItemCopyAttribute.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        cs.MDItemCopyAttribute.restype = ctypes.c_void_p
+
+        last_used_key = ctypes.c_void_p.in_dll(cs, 'kMDItemLastUsedDate').value
+    except (OSError, AttributeError, ValueError):
+        return None
+
+    return cf, cs, last_used_key
+
+
+def _last_used_dates_from_mditem(app_paths):
+    """Read kMDItemLastUsedDate in-process via MDItemCopyAttribute."""
+    api = _load_metadata_api()
+    if api is None:
+        return None
+
+    cf, cs, last_used_key = api
+    date_type_id = cf.CFDateGetTypeID()
+    dates = {}
+
+    for app_path in app_paths:
+        path_ref = cf.CFStringCreateWithCString(
+            None, str(app_path).encode('utf-8'), CF_STRING_ENCODING_UTF8
+        )
+        if not path_ref:
+            continue
+        try:
+            item = cs.MDItemCreate(None, path_ref)
+            if not item:
+                continue
             try:
-                last_opened = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                pass
+                value = cs.MDItemCopyAttribute(item, last_used_key)
+                if not value:
+                    continue
+                try:
+                    if cf.CFGetTypeID(value) == date_type_id:
+                        seconds = cf.CFDateGetAbsoluteTime(value)
+                        dates[str(app_path)] = CF_ABSOLUTE_TIME_EPOCH + timedelta(seconds=seconds)
+                finally:
+                    cf.CFRelease(value)
+            finally:
+                cf.CFRelease(item)
+        finally:
+            cf.CFRelease(path_ref)
+
+    return dates
+
+
+def _last_used_dates_from_mdls(app_paths):
+    """Read kMDItemLastUsedDate for all apps with a single mdls invocation."""
+    dates = {}
+    if not app_paths:
+        return dates
+
+    try:
+        cmd = ['mdls', '-name', 'kMDItemLastUsedDate', '-raw', *map(str, app_paths)]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
     except Exception:
-        pass
+        return dates
+
+    # With -raw, values for multiple files are separated by NUL characters
+    values = result.stdout.split('\0')
+    if len(values) == len(app_paths) + 1 and not values[-1]:
+        values.pop()
+    if len(values) != len(app_paths):
+        return dates
+
+    for app_path, value in zip(app_paths, values, strict=True):
+        value = value.strip()
+        if not value or value == '(null)':
+            continue
+        date_str = value.replace(' +0000', '')
+        try:
+            dates[str(app_path)] = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            pass
+
+    return dates
+
+
+def get_last_used_dates(app_paths):
+    """Get kMDItemLastUsedDate for many applications, keyed by app path."""
+    # Prefer the in-process MDItem API, fall back to one batched mdls call
+    dates = _last_used_dates_from_mditem(app_paths)
+    if dates is None:
+        dates = _last_used_dates_from_mdls(app_paths)
+    return dates
 
-    # Method 2: Check Application Support folder modification time
-    folders_to_check = []
 
-    if app_name in APP_FOLDER_MAPPING:
+def get_app_last_opened(app_path, last_used_dates=None):
+    """Get last opened date for an application using multiple methods."""
+    app_name = app_path.stem
+
+    # Method 1: Check kMDItemLastUsedDate metadata
+    if last_used_dates is None:
+        last_used_dates = get_last_used_dates([app_path])
+    last_opened = last_used_dates.get(str(app_path))
+
+    # Method 2: Check Application Support folder modification time
+    if app_name in APP_FOLDER_MAPPING_PATHS:
         # Use custom mapping
-        for folder_name in APP_FOLDER_MAPPING[app_name].get('data', []):
-            folders_to_check.append(Path.home() / 'Library/Application Support' / folder_name)
-        for folder_name in APP_FOLDER_MAPPING[app_name].get('cache', []):
-            folders_to_check.append(Path.home() / 'Library/Caches' / folder_name)
+        data_paths, cache_paths = APP_FOLDER_MAPPING_PATHS[app_name]
+        folders_to_check = [*data_paths, *cache_paths]
     else:
         # Use default folders
-        folders_to_check.append(Path.home() / 'Library/Application Support' / app_name)
-        folders_to_check.append(Path.home() / 'Library/Caches' / app_name)
+        folders_to_check = [_APP_SUPPORT / app_name, _CACHES / app_name]
 
     # Check all folders and find the most recent modification
     for folder in folders_to_check:
         try:
-            if folder.exists():
-                mtime = folder.stat().st_mtime
-                folder_date = datetime.fromtimestamp(mtime)
-                if not last_opened or folder_date > last_opened:
-                    last_opened = folder_date
+            mtime = folder.stat().st_mtime
         except (OSError, PermissionError):
-            pass
+            continue
+        folder_date = datetime.fromtimestamp(mtime)
+        if not last_opened or folder_date > last_opened:
+            last_opened = folder_date
 
     return last_opened
 
 
-def analyze_application(app_path):
+def analyze_application(app_path, last_used_dates=None, reuse_chrome_results=False):
     """Analyze a single application."""
     app_path = Path(app_path)
 
-    if not app_path.exists() or not app_path.is_dir():
+    if not app_path.is_dir():
         return None
 
-    app_info = {
-        'name': app_path.stem,
-        'path': str(app_path),
-        'size': 0,
-        'data_size': 0,
-        'cache_size': 0,
-        'created': None,
-        'modified': None,
-        'last_opened': None,
-        'bundle_id': 'Unknown',
-        'version': 'Unknown',
-    }
+    app_info = AppInfo(name=app_path.stem, path=str(app_path))
 
     try:
         # Get size
-        app_info['size'] = get_directory_size(app_path)
+        app_info.size = get_directory_size(app_path)
 
         # Get creation and modification time
         stat_info = app_path.stat()
-        app_info['created'] = datetime.fromtimestamp(stat_info.st_birthtime)
-        app_info['modified'] = datetime.fromtimestamp(stat_info.st_mtime)
+        app_info.created = datetime.fromtimestamp(stat_info.st_birthtime)
+        app_info.modified = datetime.fromtimestamp(stat_info.st_mtime)
 
         # Get plist info
-        plist_info = get_app_info_from_plist(app_path)
-        app_info.update(plist_info)
+        for key, value in get_app_info_from_plist(app_path).items():
+            setattr(app_info, key, value)
 
         # Try to get last opened time
-        last_opened = get_app_last_opened(app_path)
+        last_opened = get_app_last_opened(app_path, last_used_dates)
         if last_opened:
-            app_info['last_opened'] = last_opened
+            app_info.last_opened = last_opened
 
         # Get Application Support (data) size
         app_name = app_path.stem
 
         # Special handling for Google Chrome
         if app_name == 'Google Chrome' and HAS_CHROME_ANALYZER:
-            chrome_analysis = ChromeAnalyzer.analyze()
-            app_info['data_size'] = chrome_analysis['data_size']
-            app_info['cache_size'] = chrome_analysis['cache_size']
+            chrome_analysis = ChromeAnalyzer.analyze(reuse_saved=reuse_chrome_results)
+            app_info.data_size = chrome_analysis['data_size']
+            app_info.cache_size = chrome_analysis['cache_size']
             if chrome_analysis['last_used']:
-                app_info['last_opened'] = chrome_analysis['last_used']
+                app_info.last_opened = chrome_analysis['last_used']
         # Check if app has special folder mapping
-        elif app_name in APP_FOLDER_MAPPING:
+        elif app_name in APP_FOLDER_MAPPING_PATHS:
+            data_paths, cache_paths = APP_FOLDER_MAPPING_PATHS[app_name]
+
             # Use custom mapping for data folders
-            for folder_name in APP_FOLDER_MAPPING[app_name].get('data', []):
-                data_path = Path.home() / 'Library/Application Support' / folder_name
-                if data_path.exists():
-                    app_info['data_size'] += get_directory_size(data_path)
+            for data_path in data_paths:
+                app_info.data_size += get_directory_size(data_path)
 
             # Use custom mapping for cache folders
-            for folder_name in APP_FOLDER_MAPPING[app_name].get('cache', []):
-                cache_path = Path.home() / 'Library/Caches' / folder_name
-                if cache_path.exists():
-                    app_info['cache_size'] += get_directory_size(cache_path)
+            for cache_path in cache_paths:
+                app_info.cache_size += get_directory_size(cache_path)
         else:
-            # Use default folder name (app name)
-            app_support = Path.home() / 'Library/Application Support' / app_name
-            if app_support.exists():
-                app_info['data_size'] = get_directory_size(app_support)
-
-            cache_dir = Path.home() / 'Library/Caches' / app_name
-            if cache_dir.exists():
-                app_info['cache_size'] = get_directory_size(cache_dir)
+            # Use default folder name (app name); missing folders size to 0
+            app_info.data_size = get_directory_size(_APP_SUPPORT / app_name)
+            app_info.cache_size = get_directory_size(_CACHES / app_name)
 
     except (OSError, PermissionError):
         return None
@@ -198,7 +486,9 @@ def analyze_application(app_path):
     return app_info
 
 
-def analyze_applications_folder(folder_path='/Applications'):
+def analyze_applications_folder(
+    folder_path='/Applications', verbose=False, reuse_chrome_results=False
+):
     """Analyze all applications in a folder."""
     folder = Path(folder_path)
 
@@ -206,18 +496,35 @@ def analyze_applications_folder(folder_path='/Applications'):
         print(f'Folder not found: {folder_path}')
         return []
 
+    app_paths = [item for item in folder.iterdir() if item.suffix == '.app']
+    last_used_dates = get_last_used_dates(app_paths)
     apps = []
 
-    for item in folder.iterdir():
-        if item.suffix == '.app':
-            print(f'Analyzing: {item.name}')
-            app_info = analyze_application(item)
-            if app_info and app_info['size'] > 0:
+    def analyze(app_path):
+        return analyze_application(app_path, last_used_dates, reuse_chrome_results)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for item, app_info in zip(app_paths, executor.map(analyze, app_paths), strict=True):
+            if verbose:
+                print(f'Analyzing: {item.name}')
+            if app_info and app_info.size > 0:
                 apps.append(app_info)
 
     return apps
 
 
+# Sort key and descending flag for each --sort choice
+APP_SORT_KEYS = {
+    'size': (lambda x: x.size, True),
+    'created': (lambda x: x.created or datetime.min, True),
+    'modified': (lambda x: x.modified or datetime.min, True),
+    'name': (lambda x: x.name.lower(), False),
+}
+
+# Name, app size, data, cache, installed, modified and last used columns
+APP_ROW_FORMAT = '{:<30} {:>11} {:>11} {:>11} {:>11} {:>11} {:>11}\n'
+
+
 def print_analysis(apps, sort_by='size', top_n=None):
     """Print application analysis results."""
 
@@ -226,119 +533,144 @@ def print_analysis(apps, sort_by='size', top_n=None):
         return
 
     # Sort applications
-    if sort_by == 'size':
-        apps.sort(key=lambda x: x['size'], reverse=True)
-    elif sort_by == 'created':
-        apps.sort(key=lambda x: x['created'] or datetime.min, reverse=True)
-    elif sort_by == 'modified':
-        apps.sort(key=lambda x: x['modified'] or datetime.min, reverse=True)
-    elif sort_by == 'name':
-        apps.sort(key=lambda x: x['name'].lower())
-
-    if top_n:
+    if sort_by in APP_SORT_KEYS:
+        key, reverse = APP_SORT_KEYS[sort_by]
+        if top_n:
+            # Select the top N without sorting every app
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            apps = select(top_n, apps, key=key)
+        else:
+            apps.sort(key=key, reverse=reverse)
+    elif top_n:
         apps = apps[:top_n]
 
-    print(f'\n{"=" * 100}')
-    print(f'Application Analysis ({len(apps)} apps)')
-    print(f'{"=" * 100}\n')
+    # Buffer the report and write it in one call
+    out = []
+    out.append(f'\n{"=" * 100}\n')
+    out.append(f'Application Analysis ({len(apps)} apps)\n')
+    out.append(f'{"=" * 100}\n\n')
 
-    total_size = sum(app['size'] for app in apps)
+    total_size = sum(app.size for app in apps)
 
     # Print header
-    print(
-        f'{"Application":<30} {"App Size":>11} {"Data":>11} {"Cache":>11} {"Installed":>11} {"Modified":>11} {"Last Used":>11}'
+    out.append(
+        APP_ROW_FORMAT.format(
+            'Application', 'App Size', 'Data', 'Cache', 'Installed', 'Modified', 'Last Used'
+        )
     )
-    print(f'{"-" * 120}')
-
-    for app in apps:
-        name = app['name'][:28]
-        size = format_bytes(app['size'])
-        data_size = format_bytes(app['data_size']) if app['data_size'] > 0 else '-'
-        cache_size = format_bytes(app['cache_size']) if app['cache_size'] > 0 else '-'
-        created = app['created'].strftime('%Y-%m-%d') if app['created'] else 'Unknown'
-        modified = app['modified'].strftime('%Y-%m-%d') if app['modified'] else 'Unknown'
-        last_used = app['last_opened'].strftime('%Y-%m-%d') if app['last_opened'] else 'Never'
-
-        print(
-            f'{name:<30} {size:>11} {data_size:>11} {cache_size:>11} {created:>11} {modified:>11} {last_used:>11}'
+    out.append(f'{"-" * 120}\n')
+
+    rows = [
+        (
+            app.name[:28],
+            format_bytes(app.size),
+            format_bytes(app.data_size) if app.data_size > 0 else '-',
+            format_bytes(app.cache_size) if app.cache_size > 0 else '-',
+            app.created.strftime('%Y-%m-%d') if app.created else 'Unknown',
+            app.modified.strftime('%Y-%m-%d') if app.modified else 'Unknown',
+            app.last_opened.strftime('%Y-%m-%d') if app.last_opened else 'Never',
         )
+        for app in apps
+    ]
+    out.append(''.join(APP_ROW_FORMAT.format(*row) for row in rows))
 
-    print(f'\n{"=" * 100}')
-    print(f'Total Storage Used: {format_bytes(total_size)}')
-    print(f'{"=" * 100}\n')
+    out.append(f'\n{"=" * 100}\n')
+    out.append(f'Total Storage Used: {format_bytes(total_size)}\n')
+    out.append(f'{"=" * 100}\n\n')
+    sys.stdout.write(''.join(out))
 
 
-def print_detailed_analysis(apps):
+def print_detailed_analysis(apps, sort_by='size'):
     """Print detailed analysis with statistics."""
     if not apps:
         return
 
-    total_size = sum(app['size'] for app in apps)
-    total_data = sum(app['data_size'] for app in apps)
-    total_cache = sum(app['cache_size'] for app in apps)
-    avg_size = total_size / len(apps)
+    # Listings are ordered by size; equal sizes keep the order of the sort_by table,
+    # which print_analysis no longer leaves applied to apps when --top is used
+    tie_key, tie_reverse = APP_SORT_KEYS.get(sort_by, (None, False))
+
+    def sort_by_size(listing):
+        if tie_key:
+            listing.sort(key=tie_key, reverse=tie_reverse)
+        listing.sort(key=lambda x: x.size, reverse=True)
 
-    # Calculate age statistics
+    # Calculate totals and age statistics in a single pass
     now = datetime.now()
+    total_size = total_data = total_cache = 0
     old_apps = []  # Not modified in 1+ year
     recent_apps = []  # Modified in last 30 days
     never_used = []  # Never opened
     not_used_recently = []  # Not used in 6+ months
+    old_size = never_used_size = not_used_size = 0
 
     for app in apps:
-        if app['modified']:
-            days_since_modified = (now - app['modified']).days
+        size = app.size
+        total_size += size
+        total_data += app.data_size
+        total_cache += app.cache_size
+
+        modified = app.modified
+        if modified:
+            days_since_modified = (now - modified).days
             if days_since_modified > 365:
                 old_apps.append(app)
+                old_size += size
             elif days_since_modified <= 30:
                 recent_apps.append(app)
 
-        if app['last_opened'] is None:
+        last_opened = app.last_opened
+        if last_opened is None:
             never_used.append(app)
-        elif app['last_opened']:
-            days_since_used = (now - app['last_opened']).days
+            never_used_size += size
+        elif last_opened:
+            days_since_used = (now - last_opened).days
             if days_since_used > 180:
                 not_used_recently.append(app)
+                not_used_size += size
+
+    avg_size = total_size / len(apps)
 
-    print('\nStatistics:')
-    print(f'  Total Applications:     {len(apps)}')
-    print(f'  Total App Size:         {format_bytes(total_size)}')
-    print(f'  Total Data Size:        {format_bytes(total_data)}')
-    print(f'  Total Cache Size:       {format_bytes(total_cache)}')
-    print(f'  Combined Total:         {format_bytes(total_size + total_data + total_cache)}')
-    print(f'  Average App Size:       {format_bytes(avg_size)}')
-    print(f'  Recently Modified:      {len(recent_apps)} apps (last 30 days)')
-    print(f'  Old Applications:       {len(old_apps)} apps (1+ year old)')
-    print(f'  Never Used:             {len(never_used)} apps')
-    print(f'  Not Used Recently:      {len(not_used_recently)} apps (6+ months)')
+    # Buffer the report and write it in one call
+    out = ['\nStatistics:\n']
+    out.append(f'  Total Applications:     {len(apps)}\n')
+    out.append(f'  Total App Size:         {format_bytes(total_size)}\n')
+    out.append(f'  Total Data Size:        {format_bytes(total_data)}\n')
+    out.append(f'  Total Cache Size:       {format_bytes(total_cache)}\n')
+    out.append(f'  Combined Total:         {format_bytes(total_size + total_data + total_cache)}\n')
+    out.append(f'  Average App Size:       {format_bytes(avg_size)}\n')
+    out.append(f'  Recently Modified:      {len(recent_apps)} apps (last 30 days)\n')
+    out.append(f'  Old Applications:       {len(old_apps)} apps (1+ year old)\n')
+    out.append(f'  Never Used:             {len(never_used)} apps\n')
+    out.append(f'  Not Used Recently:      {len(not_used_recently)} apps (6+ months)\n')
 
     if never_used:
-        never_used_size = sum(app['size'] for app in never_used)
-        print(f'\n  Never Used Apps ({len(never_used)} apps, {format_bytes(never_used_size)}):')
-        never_used.sort(key=lambda x: x['size'], reverse=True)
+        out.append(
+            f'\n  Never Used Apps ({len(never_used)} apps, {format_bytes(never_used_size)}):\n'
+        )
+        sort_by_size(never_used)
         for app in never_used:
-            print(f'    {app["name"][:50]:<50} {format_bytes(app["size"]):>12}')
+            out.append(f'    {app.name[:50]:<50} {format_bytes(app.size):>12}\n')
 
     if not_used_recently:
-        not_used_size = sum(app['size'] for app in not_used_recently)
-        print(
-            f'\n  Not Used in 6+ Months ({len(not_used_recently)} apps, {format_bytes(not_used_size)}):'
+        out.append(
+            f'\n  Not Used in 6+ Months ({len(not_used_recently)} apps, {format_bytes(not_used_size)}):\n'
         )
-        not_used_recently.sort(key=lambda x: x['size'], reverse=True)
+        sort_by_size(not_used_recently)
         for app in not_used_recently:
-            days = (now - app['last_opened']).days
-            last_used = app['last_opened'].strftime('%Y-%m-%d') if app['last_opened'] else 'Never'
-            print(f'    {app["name"][:40]:<40} {format_bytes(app["size"]):>12}  Last: {last_used}')
+            days = (now - app.last_opened).days
+            last_used = app.last_opened.strftime('%Y-%m-%d') if app.last_opened else 'Never'
+            out.append(f'    {app.name[:40]:<40} {format_bytes(app.size):>12}  Last: {last_used}\n')
 
     if old_apps:
-        old_size = sum(app['size'] for app in old_apps)
-        print(
-            f'\n  Old Applications (Not Modified in 1+ Year - {len(old_apps)} apps, {format_bytes(old_size)}):'
+        out.append(
+            f'\n  Old Applications (Not Modified in 1+ Year - {len(old_apps)} apps, {format_bytes(old_size)}):\n'
         )
-        old_apps.sort(key=lambda x: x['size'], reverse=True)
+        sort_by_size(old_apps)
         for app in old_apps:
-            days = (now - app['modified']).days
-            print(f'    {app["name"][:50]:<50} {format_bytes(app["size"]):>12}  ({days} days)')
+            days = (now - app.modified).days
+            out.append(f'    {app.name[:50]:<50} {format_bytes(app.size):>12}  ({days} days)\n')
+
+    sys.stdout.write(''.join(out))
 
 
 def main():
@@ -368,25 +700,39 @@ def main():
         '--no-detailed', action='store_false', dest='detailed', help='Hide detailed statistics'
     )
     parser.add_argument('--user', action='store_true', help='Also analyze ~/Applications folder')
+    parser.add_argument(
+        '--verbose', action='store_true', help='Print each application as it is analyzed'
+    )
+    parser.add_argument(
+        '--reuse-chrome-results',
+        action='store_true',
+        help="Reuse Chrome's data size from the previous run when its folders are unchanged",
+    )
 
     args = parser.parse_args()
 
     # Analyze main folder
-    apps = analyze_applications_folder(args.folder)
+    apps = analyze_applications_folder(
+        args.folder, verbose=args.verbose, reuse_chrome_results=args.reuse_chrome_results
+    )
 
     # Also analyze user Applications if requested
     if args.user:
-        user_apps_path = Path.home() / 'Applications'
+        user_apps_path = _HOME / 'Applications'
         if user_apps_path.exists():
             print('\nAnalyzing user applications...')
-            user_apps = analyze_applications_folder(str(user_apps_path))
+            user_apps = analyze_applications_folder(
+                str(user_apps_path),
+                verbose=args.verbose,
+                reuse_chrome_results=args.reuse_chrome_results,
+            )
             apps.extend(user_apps)
 
     # Print results
     print_analysis(apps, sort_by=args.sort, top_n=args.top)
 
     if args.detailed:
-        print_detailed_analysis(apps)
+        print_detailed_analysis(apps, sort_by=args.sort)
 
 
 if __name__ == '__main__':
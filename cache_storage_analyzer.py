@@ -5,47 +5,65 @@ Analyzes cache folders to identify size, file count, and age statistics.
 """
 
 import argparse
+import bisect
+import heapq
 import os
-from collections import defaultdict
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Directory sizing is I/O-bound, so use more threads than cores
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-def format_bytes(bytes_size):
-    """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f'{bytes_size:.2f} {unit}'
-        bytes_size /= 1024.0
-    return f'{bytes_size:.2f} PB'
+SECONDS_PER_DAY = 60 * 60 * 24
+
+# Upper bounds (inclusive, in days) of each age bucket; older files fall in the last one
+AGE_BUCKET_LIMITS = (7, 30, 90, 365)
+AGE_BUCKET_NAMES = ('0-7 days', '7-30 days', '30-90 days', '90-365 days', '1+ years')
+
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
-def get_file_age_days(filepath):
-    """Get file age in days."""
-    try:
-        mtime = os.path.getmtime(filepath)
-        age = datetime.now().timestamp() - mtime
-        return age / (60 * 60 * 24)  # Convert to days
-    except OSError:
-        return 0
+def format_bytes(bytes_size):
+    """Convert bytes to human-readable format."""
+    if bytes_size < 1024:
+        return f'{bytes_size:.2f} B'
+    # Each unit is 10 bits wide, so the bit length picks the unit directly
+    unit = min((int(bytes_size).bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f'{bytes_size / (1 << (10 * unit)):.2f} {BYTE_UNITS[unit]}'
 
 
 def get_directory_size(path):
     """Calculate total size of a directory."""
     total = 0
-    try:
-        for item in path.rglob('*'):
-            try:
-                if item.is_file():
-                    total += item.stat().st_size
-            except (OSError, PermissionError):
-                continue
-    except (OSError, PermissionError):
-        pass
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except (OSError, PermissionError):
+                        continue
+        except (OSError, PermissionError):
+            continue
     return total
 
 
-def analyze_directory(path, recursive=True, show_subfolders=False, top_n=30):
+def analyze_directory(
+    path,
+    recursive=True,
+    show_subfolders=False,
+    top_n=30,
+    collect_types=True,
+    collect_ages=True,
+    now_ts=None,
+):
     """Analyze a directory and return statistics."""
     path = Path(path).expanduser()
 
@@ -59,98 +77,107 @@ def analyze_directory(path, recursive=True, show_subfolders=False, top_n=30):
         'oldest_file': None,
         'newest_file': None,
         'largest_file': None,
-        'file_types': defaultdict(lambda: {'count': 0, 'size': 0}),
-        'age_distribution': {
-            '0-7 days': 0,
-            '7-30 days': 0,
-            '30-90 days': 0,
-            '90-365 days': 0,
-            '1+ years': 0,
-        },
+        'file_types': {},
+        'age_distribution': {},
         'subfolders': [],
     }
 
-    oldest_time = datetime.now().timestamp()
+    # Reference time for file ages; callers pass one to share it across a run
+    if now_ts is None:
+        now_ts = time.time()
+    oldest_time = now_ts
     newest_time = 0
     largest_size = 0
+    type_count = {}
+    type_size = {}
+    age_counts = [0] * len(AGE_BUCKET_NAMES)
 
-    try:
-        if recursive:
-            iterator = path.rglob('*')
-        else:
-            iterator = path.glob('*')
-
-        for item in iterator:
-            try:
-                if item.is_file():
-                    stats['file_count'] += 1
-                    size = item.stat().st_size
-                    stats['total_size'] += size
-                    mtime = item.stat().st_mtime
-
-                    # Track oldest file
-                    if mtime < oldest_time:
-                        oldest_time = mtime
-                        stats['oldest_file'] = (str(item), mtime)
-
-                    # Track newest file
-                    if mtime > newest_time:
-                        newest_time = mtime
-                        stats['newest_file'] = (str(item), mtime)
-
-                    # Track largest file
-                    if size > largest_size:
-                        largest_size = size
-                        stats['largest_file'] = (str(item), size)
-
-                    # File type statistics
-                    ext = item.suffix.lower() if item.suffix else '(no extension)'
-                    stats['file_types'][ext]['count'] += 1
-                    stats['file_types'][ext]['size'] += size
-
-                    # Age distribution
-                    age_days = get_file_age_days(item)
-                    if age_days <= 7:
-                        stats['age_distribution']['0-7 days'] += 1
-                    elif age_days <= 30:
-                        stats['age_distribution']['7-30 days'] += 1
-                    elif age_days <= 90:
-                        stats['age_distribution']['30-90 days'] += 1
-                    elif age_days <= 365:
-                        stats['age_distribution']['90-365 days'] += 1
-                    else:
-                        stats['age_distribution']['1+ years'] += 1
-
-                elif item.is_dir():
-                    stats['folder_count'] += 1
-
-            except (OSError, PermissionError):
-                continue
-
-    except (OSError, PermissionError) as e:
-        print(f'Error accessing {path}: {e}')
-        return None
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            stats['file_count'] += 1
+                            st = entry.stat(follow_symlinks=False)
+                            size = st.st_size
+                            stats['total_size'] += size
+                            # Track largest file
+                            if size > largest_size:
+                                largest_size = size
+                                stats['largest_file'] = (entry.path, size)
+
+                            # File type statistics
+                            if collect_types:
+                                # Same rule as Path.suffix: the last dot must be neither
+                                # the first nor the last character of the name
+                                name = entry.name
+                                dot = name.rfind('.')
+                                if 0 < dot < len(name) - 1:
+                                    ext = sys.intern(name[dot:].lower())
+                                else:
+                                    ext = '(no extension)'
+                                type_count[ext] = type_count.get(ext, 0) + 1
+                                type_size[ext] = type_size.get(ext, 0) + size
+
+                            if collect_ages:
+                                mtime = st.st_mtime
+
+                                # Track oldest file
+                                if mtime < oldest_time:
+                                    oldest_time = mtime
+                                    stats['oldest_file'] = (entry.path, mtime)
+
+                                # Track newest file
+                                if mtime > newest_time:
+                                    newest_time = mtime
+                                    stats['newest_file'] = (entry.path, mtime)
+
+                                # Age distribution
+                                age_days = (now_ts - mtime) / SECONDS_PER_DAY
+                                age_counts[bisect.bisect_left(AGE_BUCKET_LIMITS, age_days)] += 1
+
+                        elif entry.is_dir(follow_symlinks=False):
+                            stats['folder_count'] += 1
+                            if recursive:
+                                stack.append(entry.path)
+
+                    except (OSError, PermissionError):
+                        continue
+
+        except NotADirectoryError:
+            # A regular file has no entries to walk, so it analyzes as empty
+            continue
+        except (OSError, PermissionError) as e:
+            if current == str(path):
+                print(f'Error accessing {path}: {e}')
+                return None
+            continue
+
+    stats['age_distribution'] = dict(zip(AGE_BUCKET_NAMES, age_counts, strict=True))
+    stats['file_types'] = {
+        ext: {'count': count, 'size': type_size[ext]} for ext, count in type_count.items()
+    }
 
     # Analyze immediate subfolders if requested
     if show_subfolders:
         subfolder_sizes = {}
         try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    try:
-                        size = get_directory_size(item)
-                        if size > 0:
-                            subfolder_sizes[str(item)] = size
-                    except (OSError, PermissionError):
-                        continue
+            subfolders = [item for item in path.iterdir() if item.is_dir()]
         except (OSError, PermissionError):
-            pass
+            subfolders = []
 
-        # Sort and get top N
-        sorted_subfolders = sorted(subfolder_sizes.items(), key=lambda x: x[1], reverse=True)[
-            :top_n
-        ]
-        stats['subfolders'] = sorted_subfolders
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for item, size in zip(
+                subfolders, executor.map(get_directory_size, subfolders), strict=True
+            ):
+                if size > 0:
+                    subfolder_sizes[str(item)] = size
+
+        # Keep only the top N without sorting every subfolder
+        stats['subfolders'] = heapq.nlargest(top_n, subfolder_sizes.items(), key=lambda x: x[1])
 
     return stats
 
@@ -161,46 +188,51 @@ def print_stats(path, stats):
         print(f' Could not analyze: {path}')
         return
 
-    print(f'\n{"=" * 70}')
-    print(f'Cache Folder: {path}')
-    print(f'{"=" * 70}')
+    # Buffer the report and write it in one call
+    out = []
+    out.append(f'\n{"=" * 70}\n')
+    out.append(f'Cache Folder: {path}\n')
+    out.append(f'{"=" * 70}\n')
 
-    print('\nOverall Statistics:')
-    print(f'  Total Size:      {format_bytes(stats["total_size"])}')
-    print(f'  Files:           {stats["file_count"]:,}')
-    print(f'  Folders:         {stats["folder_count"]:,}')
+    out.append('\nOverall Statistics:\n')
+    out.append(f'  Total Size:      {format_bytes(stats["total_size"])}\n')
+    out.append(f'  Files:           {stats["file_count"]:,}\n')
+    out.append(f'  Folders:         {stats["folder_count"]:,}\n')
 
     if stats['oldest_file']:
         oldest_date = datetime.fromtimestamp(stats['oldest_file'][1]).strftime('%Y-%m-%d %H:%M:%S')
-        print(f'  Oldest File:     {oldest_date}')
+        out.append(f'  Oldest File:     {oldest_date}\n')
 
     if stats['newest_file']:
         newest_date = datetime.fromtimestamp(stats['newest_file'][1]).strftime('%Y-%m-%d %H:%M:%S')
-        print(f'  Newest File:     {newest_date}')
+        out.append(f'  Newest File:     {newest_date}\n')
 
     if stats['largest_file']:
-        print(f'  Largest File:    {format_bytes(stats["largest_file"][1])}')
-        print(f'                   {Path(stats["largest_file"][0]).name}')
+        out.append(f'  Largest File:    {format_bytes(stats["largest_file"][1])}\n')
+        out.append(f'                   {Path(stats["largest_file"][0]).name}\n')
 
-    print('\nAge Distribution:')
-    for age_range, count in stats['age_distribution'].items():
-        if count > 0:
-            print(f'  {age_range:15} {count:,} files')
+    if any(stats['age_distribution'].values()):
+        out.append('\nAge Distribution:\n')
+        for age_range, count in stats['age_distribution'].items():
+            if count > 0:
+                out.append(f'  {age_range:15} {count:,} files\n')
 
     if stats['file_types']:
-        print('\nTop File Types by Size:')
+        out.append('\nTop File Types by Size:\n')
         sorted_types = sorted(
             stats['file_types'].items(), key=lambda x: x[1]['size'], reverse=True
         )[:10]
 
         for ext, data in sorted_types:
-            print(f'  {ext:20} {data["count"]:6,} files  {format_bytes(data["size"]):>12}')
+            out.append(f'  {ext:20} {data["count"]:6,} files  {format_bytes(data["size"]):>12}\n')
 
     if stats['subfolders']:
-        print(f'\nTop {len(stats["subfolders"])} Largest Subfolders:')
+        out.append(f'\nTop {len(stats["subfolders"])} Largest Subfolders:\n')
         for subfolder, size in stats['subfolders']:
             folder_name = Path(subfolder).name
-            print(f'  {format_bytes(size):>12}  {folder_name}')
+            out.append(f'  {format_bytes(size):>12}  {folder_name}\n')
+
+    sys.stdout.write(''.join(out))
 
 
 def get_common_cache_locations():
@@ -233,6 +265,12 @@ def main():
     parser.add_argument(
         '--top-n', type=int, default=30, help='Number of top subfolders to display (default: 30)'
     )
+    parser.add_argument(
+        '--no-detailed',
+        action='store_false',
+        dest='detailed',
+        help='Skip file type and age statistics (faster on large caches)',
+    )
 
     args = parser.parse_args()
 
@@ -253,13 +291,24 @@ def main():
     total_size = 0
     results = []
 
-    for path in paths_to_analyze:
-        stats = analyze_directory(
+    now_ts = time.time()
+
+    def analyze(path):
+        return analyze_directory(
             path,
             recursive=not args.no_recursive,
             show_subfolders=args.show_subfolders,
             top_n=args.top_n,
+            collect_types=args.detailed,
+            collect_ages=args.detailed,
+            now_ts=now_ts,
         )
+
+    # Cap the pool: each location may open its own subfolder pool as well
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(paths_to_analyze))) as executor:
+        all_stats = list(executor.map(analyze, paths_to_analyze))
+
+    for path, stats in zip(paths_to_analyze, all_stats, strict=True):
         if stats and stats['total_size'] > 0:
             results.append((path, stats))
             total_size += stats['total_size']
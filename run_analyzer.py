@@ -4,8 +4,12 @@ MacOptima Unified Analyzer
 Runs all analyzers and generates a comprehensive HTML report.
 """
 
+import heapq
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -16,135 +20,139 @@ from application_storage_analyzer import (
 )
 from cache_storage_analyzer import analyze_directory, get_common_cache_locations
 
+# Size thresholds for the size-large / size-medium highlighting
+_GIB = 1 << 30
+_100MIB = 100 << 20
+_SIZE_CLASSES = ('', 'size-medium', 'size-large')
 
-def generate_html_report(apps_data, cache_data, output_file='storage_report.html'):
-    """Generate comprehensive HTML report of all analysis."""
+# The report tables repeat many byte counts, so memoize their formatting
+_fmt = lru_cache(maxsize=4096)(format_bytes)
 
-    # Calculate totals
-    total_apps_size = sum(app['size'] for app in apps_data)
-    total_data_size = sum(app['data_size'] for app in apps_data)
-    total_cache_size = sum(stats['total_size'] for _, stats in cache_data)
 
-    now = datetime.now()
+def _size_class(size):
+    """Return the CSS class that highlights a byte count in the report tables."""
+    return _SIZE_CLASSES[(size > _100MIB) + (size > _GIB)]
 
-    # Statistics for apps
-    never_used_apps = [app for app in apps_data if app['last_opened'] is None]
-    not_used_recently = [
-        app for app in apps_data if app['last_opened'] and (now - app['last_opened']).days > 180
-    ]
 
-    html = f"""<!DOCTYPE html>
+def _iso_date(dt):
+    """Format a datetime as YYYY-MM-DD without going through strftime."""
+    return f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d}'
+
+
+# Static parts of the report, built once at import instead of on every call
+HTML_HEAD_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>MacOptima Storage Report - {now.strftime('%Y-%m-%d %H:%M')}</title>
-    <style>
-        * {{
+"""
+
+HTML_STYLE_AND_BODY_OPEN = """    <style>
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 20px;
             min-height: 100vh;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             border-radius: 16px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
             overflow: hidden;
-        }}
+        }
 
-        header {{
+        header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
+        }
 
-        header h1 {{
+        header h1 {
             font-size: 2.5rem;
             margin-bottom: 10px;
             font-weight: 700;
-        }}
+        }
 
-        header p {{
+        header p {
             font-size: 1.1rem;
             opacity: 0.9;
-        }}
+        }
 
-        .summary {{
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             padding: 40px;
             background: #f8f9fa;
-        }}
+        }
 
-        .summary-card {{
+        .summary-card {
             background: white;
             padding: 25px;
             border-radius: 12px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
             transition: transform 0.2s, box-shadow 0.2s;
-        }}
+        }
 
-        .summary-card:hover {{
+        .summary-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 8px 15px rgba(0,0,0,0.15);
-        }}
+        }
 
-        .summary-card h3 {{
+        .summary-card h3 {
             color: #667eea;
             font-size: 0.9rem;
             text-transform: uppercase;
             letter-spacing: 1px;
             margin-bottom: 10px;
             font-weight: 600;
-        }}
+        }
 
-        .summary-card .value {{
+        .summary-card .value {
             font-size: 2rem;
             font-weight: 700;
             color: #2d3748;
-        }}
+        }
 
-        .summary-card .subtitle {{
+        .summary-card .subtitle {
             color: #718096;
             font-size: 0.85rem;
             margin-top: 5px;
-        }}
+        }
 
-        .content {{
+        .content {
             padding: 40px;
-        }}
+        }
 
-        section {{
+        section {
             margin-bottom: 50px;
-        }}
+        }
 
-        h2 {{
+        h2 {
             color: #2d3748;
             font-size: 1.8rem;
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 3px solid #667eea;
-        }}
+        }
 
-        h3 {{
+        h3 {
             color: #4a5568;
             font-size: 1.3rem;
             margin: 30px 0 15px;
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
@@ -152,118 +160,230 @@ def generate_html_report(apps_data, cache_data, output_file='storage_report.html
             border-radius: 8px;
             overflow: hidden;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
+        }
 
-        thead {{
+        thead {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
-        }}
+        }
 
-        th {{
+        th {
             padding: 15px;
             text-align: left;
             font-weight: 600;
             font-size: 0.9rem;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        th.right {{
+        th.right {
             text-align: right;
-        }}
+        }
 
-        td {{
+        td {
             padding: 12px 15px;
             border-bottom: 1px solid #e2e8f0;
             color: #4a5568;
-        }}
+        }
 
-        td.right {{
+        td.right {
             text-align: right;
-        }}
+        }
 
-        tbody tr:hover {{
+        tbody tr:hover {
             background: #f7fafc;
-        }}
+        }
 
-        tbody tr:last-child td {{
+        tbody tr:last-child td {
             border-bottom: none;
-        }}
+        }
 
-        .warning {{
+        .warning {
             background: #fff3cd;
             border-left: 4px solid #ffc107;
             padding: 15px;
             margin: 20px 0;
             border-radius: 4px;
-        }}
+        }
 
-        .info {{
+        .info {
             background: #d1ecf1;
             border-left: 4px solid #17a2b8;
             padding: 15px;
             margin: 20px 0;
             border-radius: 4px;
-        }}
+        }
 
-        .size-large {{
+        .size-large {
             color: #dc3545;
             font-weight: 600;
-        }}
+        }
 
-        .size-medium {{
+        .size-medium {
             color: #ffc107;
             font-weight: 600;
-        }}
+        }
 
-        .size-small {{
+        .size-small {
             color: #28a745;
-        }}
+        }
 
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 4px 10px;
             border-radius: 12px;
             font-size: 0.75rem;
             font-weight: 600;
             text-transform: uppercase;
-        }}
+        }
 
-        .badge-danger {{
+        .badge-danger {
             background: #fee;
             color: #c00;
-        }}
+        }
 
-        .badge-warning {{
+        .badge-warning {
             background: #fffbea;
             color: #ff8c00;
-        }}
+        }
 
-        .badge-success {{
+        .badge-success {
             background: #e6f7ed;
             color: #0a7d3a;
-        }}
+        }
 
-        footer {{
+        footer {
             background: #2d3748;
             color: white;
             padding: 20px;
             text-align: center;
             font-size: 0.9rem;
-        }}
+        }
 
-        .chart-bar {{
+        .chart-bar {
             height: 30px;
             background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
             border-radius: 4px;
             margin: 5px 0;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <header>
-            <h1>MacOptima Storage Report</h1>
+"""
+
+HTML_FOOTER = """        </footer>
+    </div>
+</body>
+</html>
+"""
+
+# Table row templates, filled with format_map from the precomputed row dicts
+HTML_APP_ROW = """
+                        <tr>
+                            <td><strong>{name}</strong></td>
+                            <td class="right">{size_fmt}</td>
+                            <td class="right">{data_fmt}</td>
+                            <td class="right">{cache_fmt}</td>
+                            <td class="right {size_class}">{total_fmt}</td>
+                            <td>{last_used}</td>
+                        </tr>
+"""
+HTML_NEVER_USED_ROW = """
+                        <tr>
+                            <td><strong>{name}</strong></td>
+                            <td class="right">{total_fmt}</td>
+                            <td>{created}</td>
+                        </tr>
+"""
+HTML_NOT_USED_ROW = """
+                        <tr>
+                            <td><strong>{name}</strong></td>
+                            <td class="right">{total_fmt}</td>
+                            <td>{last_used}</td>
+                            <td>{days_ago} days</td>
+                        </tr>
+"""
+HTML_CACHE_ROW = """
+                        <tr>
+                            <td><code>{path}</code></td>
+                            <td class="right {size_class}">{size_fmt}</td>
+                            <td class="right">{file_count:,}</td>
+                            <td class="right">{folder_count:,}</td>
+                        </tr>
+"""
+HTML_SUBFOLDER_ROW = """
+                        <tr>
+                            <td><code>{name}</code></td>
+                            <td class="right {size_class}">{size_fmt}</td>
+                        </tr>
+"""
+
+
+def generate_html_report(apps_data, cache_data, output_file='storage_report.html'):
+    """Generate comprehensive HTML report of all analysis."""
+
+    now = datetime.now()
+    # (now - last_opened).days > 180 means at least 181 whole days have passed
+    not_used_cutoff = now - timedelta(days=181)
+
+    # Calculate totals, per-app row values and usage buckets in a single pass
+    total_apps_size = total_data_size = 0
+    app_rows = []
+    never_used_apps = []
+    not_used_recently = []
+    for app in apps_data:
+        total_apps_size += app.size
+        total_data_size += app.data_size
+        total = app.size + app.data_size + app.cache_size
+        last_opened = app.last_opened
+        created = app.created
+        row = {
+            'name': app.name,
+            'size': app.size,
+            'total': total,
+            'size_class': _size_class(total),
+            'size_fmt': _fmt(app.size),
+            'data_fmt': _fmt(app.data_size) if app.data_size > 0 else '-',
+            'cache_fmt': _fmt(app.cache_size) if app.cache_size > 0 else '-',
+            'total_fmt': _fmt(total),
+            'last_used': (
+                _iso_date(last_opened)
+                if last_opened
+                else '<span class="badge badge-warning">Never</span>'
+            ),
+            'created': _iso_date(created) if created else 'Unknown',
+        }
+        app_rows.append(row)
+        if last_opened is None:
+            never_used_apps.append(row)
+        elif last_opened <= not_used_cutoff:
+            row['days_ago'] = (now - last_opened).days
+            not_used_recently.append(row)
+
+    by_size = itemgetter('size')
+
+    # Same for the cache locations, which are then ordered largest first
+    total_cache_size = 0
+    cache_rows = []
+    for path, stats in cache_data:
+        cache_size = stats['total_size']
+        total_cache_size += cache_size
+        cache_rows.append((cache_size, path, stats, _size_class(cache_size)))
+    cache_rows.sort(key=itemgetter(0), reverse=True)
+    _, largest_cache_path, largest_cache_stats, _ = (
+        cache_rows[0] if cache_rows else (0, None, {}, '')
+    )
+
+    # Stream straight to the file; the 1 MiB buffer still batches the disk writes
+    with open(output_file, 'w', buffering=1 << 20) as f:
+        w = f.write
+        w(HTML_HEAD_PREFIX)
+        w(f'    <title>MacOptima Storage Report - {now.strftime("%Y-%m-%d %H:%M")}</title>\n')
+        w(HTML_STYLE_AND_BODY_OPEN)
+        w(
+            f"""            <h1>MacOptima Storage Report</h1>
             <p>Generated on {now.strftime('%B %d, %Y at %H:%M:%S')}</p>
         </header>
 
@@ -275,43 +395,47 @@ def generate_html_report(apps_data, cache_data, output_file='storage_report.html
             </div>
             <div class="summary-card">
                 <h3>Apps Storage</h3>
-                <div class="value">{format_bytes(total_apps_size)}</div>
+                <div class="value">{_fmt(total_apps_size)}</div>
                 <div class="subtitle">Application binaries</div>
             </div>
             <div class="summary-card">
                 <h3>Data Storage</h3>
-                <div class="value">{format_bytes(total_data_size)}</div>
+                <div class="value">{_fmt(total_data_size)}</div>
                 <div class="subtitle">Application data</div>
             </div>
             <div class="summary-card">
                 <h3>Cache Storage</h3>
-                <div class="value">{format_bytes(total_cache_size)}</div>
+                <div class="value">{_fmt(total_cache_size)}</div>
                 <div class="subtitle">System-wide caches</div>
             </div>
             <div class="summary-card">
                 <h3>Total Storage</h3>
-                <div class="value">{format_bytes(total_apps_size + total_data_size + total_cache_size)}</div>
+                <div class="value">{_fmt(total_apps_size + total_data_size + total_cache_size)}</div>
                 <div class="subtitle">Combined total</div>
             </div>
             <div class="summary-card">
                 <h3>Reclaimable Space</h3>
-                <div class="value">{format_bytes(total_cache_size + sum(app['size'] for app in never_used_apps))}</div>
+                <div class="value">{_fmt(total_cache_size + sum(row['size'] for row in never_used_apps))}</div>
                 <div class="subtitle">Potential cleanup</div>
             </div>
         </div>
 
         <div class="content">
 """
+        )
 
-    # Applications section
-    html += """
+        # Applications section
+        w(
+            """
             <section>
                 <h2>=� Applications Storage Analysis</h2>
 """
+        )
 
-    # Top 20 applications by size
-    apps_by_size = sorted(apps_data, key=lambda x: x['size'], reverse=True)[:20]
-    html += """
+        # Top 20 applications by size
+        apps_by_size = heapq.nlargest(20, app_rows, key=by_size)
+        w(
+            """
                 <h3>Top 20 Largest Applications</h3>
                 <table>
                     <thead>
@@ -326,38 +450,22 @@ def generate_html_report(apps_data, cache_data, output_file='storage_report.html
                     </thead>
                     <tbody>
 """
-    for app in apps_by_size:
-        total = app['size'] + app['data_size'] + app['cache_size']
-        size_class = (
-            'size-large' if total > 1024**3 else 'size-medium' if total > 100 * 1024**2 else ''
-        )
-        last_used = (
-            app['last_opened'].strftime('%Y-%m-%d')
-            if app['last_opened']
-            else '<span class="badge badge-warning">Never</span>'
         )
-        html += f"""
-                        <tr>
-                            <td><strong>{app['name']}</strong></td>
-                            <td class="right">{format_bytes(app['size'])}</td>
-                            <td class="right">{format_bytes(app['data_size']) if app['data_size'] > 0 else '-'}</td>
-                            <td class="right">{format_bytes(app['cache_size']) if app['cache_size'] > 0 else '-'}</td>
-                            <td class="right {size_class}">{format_bytes(total)}</td>
-                            <td>{last_used}</td>
-                        </tr>
-"""
-    html += """
+        for row in apps_by_size:
+            w(HTML_APP_ROW.format_map(row))
+        w(
+            """
                     </tbody>
                 </table>
 """
-
-    # Never used apps
-    if never_used_apps:
-        never_used_size = sum(
-            app['size'] + app['data_size'] + app['cache_size'] for app in never_used_apps
         )
-        html += f"""
-                <h3>� Never Used Applications ({len(never_used_apps)} apps, {format_bytes(never_used_size)})</h3>
+
+        # Never used apps
+        if never_used_apps:
+            never_used_size = sum(row['total'] for row in never_used_apps)
+            w(
+                f"""
+                <h3>� Never Used Applications ({len(never_used_apps)} apps, {_fmt(never_used_size)})</h3>
                 <div class="warning">
                     These applications have never been opened. Consider removing them to free up space.
                 </div>
@@ -371,28 +479,23 @@ def generate_html_report(apps_data, cache_data, output_file='storage_report.html
                     </thead>
                     <tbody>
 """
-        for app in sorted(never_used_apps, key=lambda x: x['size'], reverse=True):
-            total = app['size'] + app['data_size'] + app['cache_size']
-            installed = app['created'].strftime('%Y-%m-%d') if app['created'] else 'Unknown'
-            html += f"""
-                        <tr>
-                            <td><strong>{app['name']}</strong></td>
-                            <td class="right">{format_bytes(total)}</td>
-                            <td>{installed}</td>
-                        </tr>
-"""
-        html += """
+            )
+            never_used_apps.sort(key=by_size, reverse=True)
+            for row in never_used_apps:
+                w(HTML_NEVER_USED_ROW.format_map(row))
+            w(
+                """
                     </tbody>
                 </table>
 """
+            )
 
-    # Not used recently
-    if not_used_recently:
-        not_used_size = sum(
-            app['size'] + app['data_size'] + app['cache_size'] for app in not_used_recently
-        )
-        html += f"""
-                <h3>=� Not Used Recently ({len(not_used_recently)} apps, {format_bytes(not_used_size)})</h3>
+        # Not used recently
+        if not_used_recently:
+            not_used_size = sum(row['total'] for row in not_used_recently)
+            w(
+                f"""
+                <h3>=� Not Used Recently ({len(not_used_recently)} apps, {_fmt(not_used_size)})</h3>
                 <div class="info">
                     These applications haven't been used in over 6 months.
                 </div>
@@ -407,35 +510,32 @@ def generate_html_report(apps_data, cache_data, output_file='storage_report.html
                     </thead>
                     <tbody>
 """
-        for app in sorted(not_used_recently, key=lambda x: x['size'], reverse=True)[:20]:
-            total = app['size'] + app['data_size'] + app['cache_size']
-            last_used = app['last_opened'].strftime('%Y-%m-%d') if app['last_opened'] else 'Never'
-            days_ago = (now - app['last_opened']).days if app['last_opened'] else 0
-            html += f"""
-                        <tr>
-                            <td><strong>{app['name']}</strong></td>
-                            <td class="right">{format_bytes(total)}</td>
-                            <td>{last_used}</td>
-                            <td>{days_ago} days</td>
-                        </tr>
-"""
-        html += """
+            )
+            for row in heapq.nlargest(20, not_used_recently, key=by_size):
+                w(HTML_NOT_USED_ROW.format_map(row))
+            w(
+                """
                     </tbody>
                 </table>
 """
+            )
 
-    html += """
+        w(
+            """
             </section>
 """
+        )
 
-    # Cache analysis section
-    html += """
+        # Cache analysis section
+        w(
+            """
             <section>
                 <h2>=� Cache Storage Analysis</h2>
 """
+        )
 
-    cache_sorted = sorted(cache_data, key=lambda x: x[1]['total_size'], reverse=True)
-    html += """
+        w(
+            """
                 <h3>Cache Locations</h3>
                 <table>
                     <thead>
@@ -448,31 +548,28 @@ def generate_html_report(apps_data, cache_data, output_file='storage_report.html
                     </thead>
                     <tbody>
 """
-    for path, stats in cache_sorted:
-        size_class = (
-            'size-large'
-            if stats['total_size'] > 1024**3
-            else 'size-medium'
-            if stats['total_size'] > 100 * 1024**2
-            else ''
         )
-        html += f"""
-                        <tr>
-                            <td><code>{path}</code></td>
-                            <td class="right {size_class}">{format_bytes(stats['total_size'])}</td>
-                            <td class="right">{stats['file_count']:,}</td>
-                            <td class="right">{stats['folder_count']:,}</td>
-                        </tr>
-"""
-    html += """
+        for cache_size, path, stats, size_class in cache_rows:
+            w(
+                HTML_CACHE_ROW.format(
+                    path=path,
+                    size_class=size_class,
+                    size_fmt=_fmt(cache_size),
+                    file_count=stats['file_count'],
+                    folder_count=stats['folder_count'],
+                )
+            )
+        w(
+            """
                     </tbody>
                 </table>
 """
+        )
 
-    # Top subfolders from largest cache location
-    if cache_sorted and cache_sorted[0][1].get('subfolders'):
-        largest_cache_path, largest_cache_stats = cache_sorted[0]
-        html += f"""
+        # Top subfolders from largest cache location
+        if largest_cache_stats.get('subfolders'):
+            w(
+                f"""
                 <h3>Top Subfolders in {largest_cache_path}</h3>
                 <table>
                     <thead>
@@ -483,23 +580,22 @@ def generate_html_report(apps_data, cache_data, output_file='storage_report.html
                     </thead>
                     <tbody>
 """
-        for subfolder, size in largest_cache_stats['subfolders'][:15]:
-            folder_name = Path(subfolder).name
-            size_class = (
-                'size-large' if size > 1024**3 else 'size-medium' if size > 100 * 1024**2 else ''
             )
-            html += f"""
-                        <tr>
-                            <td><code>{folder_name}</code></td>
-                            <td class="right {size_class}">{format_bytes(size)}</td>
-                        </tr>
-"""
-        html += """
+            for subfolder, size in largest_cache_stats['subfolders'][:15]:
+                w(
+                    HTML_SUBFOLDER_ROW.format(
+                        name=Path(subfolder).name, size_class=_size_class(size), size_fmt=_fmt(size)
+                    )
+                )
+            w(
+                """
                     </tbody>
                 </table>
 """
+            )
 
-    html += """
+        w(
+            """
             </section>
 
             <section>
@@ -508,28 +604,32 @@ def generate_html_report(apps_data, cache_data, output_file='storage_report.html
                     <h3 style="margin-bottom: 10px;">Quick Wins</h3>
                     <ul style="margin-left: 20px; line-height: 1.8;">
 """
-    if never_used_apps:
-        never_used_size = sum(
-            app['size'] + app['data_size'] + app['cache_size'] for app in never_used_apps
         )
-        html += f"""
-                        <li><strong>Remove {len(never_used_apps)} never-used applications</strong> to free up {format_bytes(never_used_size)}</li>
+        if never_used_apps:
+            never_used_size = sum(row['total'] for row in never_used_apps)
+            w(
+                f"""
+                        <li><strong>Remove {len(never_used_apps)} never-used applications</strong> to free up {_fmt(never_used_size)}</li>
 """
+            )
 
-    if total_cache_size > 1024**3:
-        html += f"""
-                        <li><strong>Clear cache folders</strong> to reclaim {format_bytes(total_cache_size)}</li>
+        if total_cache_size > _GIB:
+            w(
+                f"""
+                        <li><strong>Clear cache folders</strong> to reclaim {_fmt(total_cache_size)}</li>
 """
+            )
 
-    if not_used_recently:
-        not_used_size = sum(
-            app['size'] + app['data_size'] + app['cache_size'] for app in not_used_recently[:10]
-        )
-        html += f"""
+        if not_used_recently:
+            not_used_size = sum(row['total'] for row in not_used_recently[:10])
+            w(
+                f"""
                         <li><strong>Review {len(not_used_recently)} unused applications</strong> (not used in 6+ months)</li>
 """
+            )
 
-    html += """
+        w(
+            f"""
                     </ul>
                 </div>
             </section>
@@ -538,47 +638,62 @@ def generate_html_report(apps_data, cache_data, output_file='storage_report.html
         <footer>
             <p>Generated by MacOptima - macOS Storage Optimization Toolkit</p>
             <p style="margin-top: 5px; opacity: 0.8;">Report generated at {now.strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </footer>
-    </div>
-</body>
-</html>
 """
-
-    # Write to file
-    with open(output_file, 'w') as f:
-        f.write(html)
+        )
+        w(HTML_FOOTER)
 
     return output_file
 
 
+def _analyze_all_caches(cache_locations):
+    """Analyze each cache location, keeping the non-empty ones as (path, stats) pairs."""
+    cache_results = []
+    for path in cache_locations:
+        # The report only shows sizes and counts, so skip type and age stats
+        stats = analyze_directory(
+            path,
+            recursive=True,
+            show_subfolders=True,
+            top_n=30,
+            collect_types=False,
+            collect_ages=False,
+        )
+        if stats and stats['total_size'] > 0:
+            cache_results.append((path, stats))
+    return cache_results
+
+
 def main():
     """Run all analyzers and generate HTML report."""
     print('MacOptima Unified Analyzer')
     print('=' * 70)
 
-    # Analyze applications
-    print('\n[1/2] Analyzing applications...')
-    apps = analyze_applications_folder('/Applications')
-
-    # Also analyze user Applications
+    # The application and cache trees are independent, so walk them concurrently
     user_apps_path = Path.home() / 'Applications'
-    if user_apps_path.exists():
-        print('      Analyzing user applications...')
-        user_apps = analyze_applications_folder(str(user_apps_path))
-        apps.extend(user_apps)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        system_apps_future = executor.submit(analyze_applications_folder, '/Applications')
+        user_apps_future = None
+        if user_apps_path.exists():
+            user_apps_future = executor.submit(analyze_applications_folder, str(user_apps_path))
+        cache_future = executor.submit(_analyze_all_caches, get_common_cache_locations())
 
-    print(f'      Found {len(apps)} applications')
+        # Analyze applications
+        print('\n[1/2] Analyzing applications...')
+        apps = system_apps_future.result()
 
-    # Analyze caches
-    print('\n[2/2] Analyzing cache locations...')
-    cache_locations = get_common_cache_locations()
-    cache_results = []
+        # Also analyze user Applications
+        if user_apps_future:
+            print('      Analyzing user applications...')
+            apps.extend(user_apps_future.result())
 
-    for path in cache_locations:
-        stats = analyze_directory(path, recursive=True, show_subfolders=True, top_n=30)
-        if stats and stats['total_size'] > 0:
-            cache_results.append((path, stats))
-            print(f'      {path}: {format_bytes(stats["total_size"])}')
+        print(f'      Found {len(apps)} applications')
+
+        # Analyze caches
+        print('\n[2/2] Analyzing cache locations...')
+        cache_results = cache_future.result()
+
+    for path, stats in cache_results:
+        print(f'      {path}: {format_bytes(stats["total_size"])}')
 
     # Generate HTML report
     print('\n[3/3] Generating HTML report...')
@@ -589,8 +704,8 @@ def main():
     print(f'   open {output_file}')
 
     # Summary
-    total_apps_size = sum(app['size'] for app in apps)
-    total_data_size = sum(app['data_size'] for app in apps)
+    total_apps_size = sum(app.size for app in apps)
+    total_data_size = sum(app.data_size for app in apps)
     total_cache_size = sum(stats['total_size'] for _, stats in cache_results)
 
     print(f'\n{"=" * 70}')
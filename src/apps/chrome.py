@@ -3,9 +3,96 @@ Google Chrome specific analyzer.
 Handles Chrome's special data and cache folder structure.
 """
 
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Folder sizes keyed by (path, directory mtime_ns), so the profile folders sized by
+# analyze_data_size are reused by get_profile_info. The mtime only changes when
+# direct children are added or removed, not when deeper files change, so analyze()
+# clears this on entry to keep the memo scoped to a single analysis.
+_SIZE_CACHE = {}
+
+# Chrome has only a handful of independent roots to walk at once
+MAX_WORKERS = 4
+
+# Opt-in store for analyze() results between runs, relative to the home folder.
+# Entries are keyed by the mtimes of the roots, every profile folder and its heavy
+# subfolders, and also expire after a day since deeper changes leave those alone.
+# Cache sizes are never stored: clearing caches must show up on the next run.
+RESULT_CACHE_PATH = 'Library/Caches/macoptima/chrome.pkl'
+RESULT_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Profile subfolders that hold most of a profile's bytes; the rest are small leveldb stores
+PROFILE_HEAVY_FOLDERS = frozenset({'Cache', 'Code Cache', 'Service Worker'})
+
+
+def _scandir_size(path):
+    """Sum regular file sizes under path with an explicit os.scandir stack."""
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        # d_type answers these without a syscall; only files need a stat
+                        if entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+def _approx_profile_size(profile_path):
+    """Estimate a profile's size from its top-level files and its heavy subfolders."""
+    total = 0
+    try:
+        with os.scandir(profile_path) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    elif entry.name in PROFILE_HEAVY_FOLDERS and entry.is_dir(
+                        follow_symlinks=False
+                    ):
+                        total += _scandir_size(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return total
+
+
+def _load_json_bytes(data):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _folder_mtime(path):
+    """Return a folder's modification time, or None if it cannot be read."""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
 
 class ChromeAnalyzer:
     """Analyzer for Google Chrome application."""
@@ -27,16 +114,33 @@ class ChromeAnalyzer:
 
     @staticmethod
     def get_folder_size(path):
-        """Calculate total size of a directory."""
+        """Calculate total size of a directory, memoized by path and mtime."""
+        try:
+            key = (str(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            return 0
+
+        size = _SIZE_CACHE.get(key)
+        if size is None:
+            size = _scandir_size(path)
+            _SIZE_CACHE[key] = size
+        return size
+
+    @classmethod
+    def get_children_size(cls, path):
+        """Calculate a directory's size child by child, caching each subfolder."""
         total = 0
         try:
-            for item in path.rglob('*'):
-                try:
-                    if item.is_file():
-                        total += item.stat().st_size
-                except (OSError, PermissionError):
-                    continue
-        except (OSError, PermissionError):
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            total += cls.get_folder_size(Path(entry.path))
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
             pass
         return total
 
@@ -47,53 +151,85 @@ class ChromeAnalyzer:
         for folder_name in cls.get_data_folders():
             folder_path = Path.home() / 'Library/Application Support' / folder_name
             if folder_path.exists():
-                total_size += cls.get_folder_size(folder_path)
+                # Per-child sizes are cached, so get_profile_info reuses them
+                total_size += cls.get_children_size(folder_path)
         return total_size
 
     @classmethod
     def analyze_cache_size(cls):
         """Analyze Chrome's cache size."""
-        total_size = 0
-        for folder_name in cls.get_cache_folders():
-            folder_path = Path.home() / 'Library/Caches' / folder_name
-            if folder_path.exists():
-                total_size += cls.get_folder_size(folder_path)
-        return total_size
+        folder_paths = [
+            Path.home() / 'Library/Caches' / folder_name for folder_name in cls.get_cache_folders()
+        ]
+        folder_paths = [path for path in folder_paths if path.exists()]
+
+        # The cache roots are independent, so walk them concurrently
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return sum(executor.map(cls.get_folder_size, folder_paths))
+
+    @classmethod
+    def get_root_folders(cls):
+        """Get absolute paths of all Chrome data and cache folders."""
+        home = Path.home()
+        folder_paths = [
+            home / 'Library/Application Support' / name for name in cls.get_data_folders()
+        ]
+        folder_paths += [home / 'Library/Caches' / name for name in cls.get_cache_folders()]
+        return folder_paths
+
+    @classmethod
+    def get_watched_folders(cls):
+        """Get the folders whose mtimes decide whether a saved analyze() result is reused."""
+        folder_paths = cls.get_root_folders()
+        chrome_data = Path.home() / 'Library/Application Support/Google/Chrome'
+        try:
+            with os.scandir(chrome_data) as it:
+                profile_paths = [
+                    Path(entry.path)
+                    for entry in it
+                    if (entry.name.startswith('Profile') or entry.name == 'Default')
+                    and entry.is_dir()
+                ]
+        except OSError:
+            profile_paths = []
+
+        for profile_path in sorted(profile_paths):
+            folder_paths.append(profile_path)
+            folder_paths += [profile_path / name for name in sorted(PROFILE_HEAVY_FOLDERS)]
+            folder_paths.append(profile_path / 'Cache/Cache_Data')
+        return folder_paths
 
     @classmethod
     def get_last_used(cls):
         """Get Chrome's last used date by checking folder modification times."""
-        last_used = None
+        # Group the roots by parent folder so each parent is scanned only once
+        wanted = {}
+        for path in cls.get_root_folders():
+            wanted.setdefault(path.parent, set()).add(path.name)
 
-        # Check Application Support folders
-        for folder_name in cls.get_data_folders():
-            folder_path = Path.home() / 'Library/Application Support' / folder_name
-            if folder_path.exists():
-                try:
-                    mtime = folder_path.stat().st_mtime
-                    folder_date = datetime.fromtimestamp(mtime)
-                    if not last_used or folder_date > last_used:
-                        last_used = folder_date
-                except (OSError, PermissionError):
-                    pass
-
-        # Check Cache folders
-        for folder_name in cls.get_cache_folders():
-            folder_path = Path.home() / 'Library/Caches' / folder_name
-            if folder_path.exists():
-                try:
-                    mtime = folder_path.stat().st_mtime
-                    folder_date = datetime.fromtimestamp(mtime)
-                    if not last_used or folder_date > last_used:
-                        last_used = folder_date
-                except (OSError, PermissionError):
-                    pass
+        latest = None
+        for parent, names in wanted.items():
+            try:
+                with os.scandir(parent) as it:
+                    for entry in it:
+                        if entry.name not in names:
+                            continue
+                        try:
+                            mtime = entry.stat().st_mtime
+                        except OSError:
+                            continue
+                        if latest is None or mtime > latest:
+                            latest = mtime
+            except OSError:
+                continue
 
-        return last_used
+        if latest is None:
+            return None
+        return datetime.fromtimestamp(latest)
 
     @classmethod
-    def get_profile_info(cls):
-        """Get Chrome profile information and sizes."""
+    def get_profile_info(cls, full=False):
+        """Get Chrome profile information and sizes (approximate unless full is set)."""
         chrome_data = Path.home() / 'Library/Application Support/Google/Chrome'
 
         if not chrome_data.exists():
@@ -102,44 +238,91 @@ class ChromeAnalyzer:
         profiles = []
 
         # Find all profile directories
-        for item in chrome_data.iterdir():
-            if item.is_dir() and (item.name.startswith('Profile') or item.name == 'Default'):
-                profile_size = cls.get_folder_size(item)
+        profile_paths = [
+            item
+            for item in chrome_data.iterdir()
+            if item.is_dir() and (item.name.startswith('Profile') or item.name == 'Default')
+        ]
 
-                # Try to get profile name from Preferences
-                prefs_file = item / 'Preferences'
-                profile_name = item.name
+        # Size the profiles concurrently
+        size_profile = cls.get_folder_size if full else _approx_profile_size
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            profile_sizes = list(executor.map(size_profile, profile_paths))
 
-                if prefs_file.exists():
-                    try:
-                        import json
-
-                        with open(prefs_file) as f:
-                            prefs = json.load(f)
-                            if 'profile' in prefs and 'name' in prefs['profile']:
-                                profile_name = prefs['profile']['name']
-                    except (OSError, PermissionError, json.JSONDecodeError, KeyError):
-                        pass
-
-                profiles.append(
-                    {
-                        'name': profile_name,
-                        'folder': item.name,
-                        'size': profile_size,
-                        'path': str(item),
-                    }
-                )
+        for item, profile_size in zip(profile_paths, profile_sizes, strict=True):
+            # Try to get profile name from Preferences
+            prefs_file = item / 'Preferences'
+            profile_name = item.name
+
+            try:
+                prefs = _load_json_bytes(prefs_file.read_bytes())
+                if 'profile' in prefs and 'name' in prefs['profile']:
+                    profile_name = prefs['profile']['name']
+            except (OSError, PermissionError, ValueError, KeyError):
+                # Missing, unreadable or malformed Preferences; keep the folder name
+                pass
+
+            profiles.append(
+                {
+                    'name': profile_name,
+                    'folder': item.name,
+                    'size': profile_size,
+                    'path': str(item),
+                }
+            )
 
         # Sort by size
         profiles.sort(key=lambda x: x['size'], reverse=True)
         return profiles
 
     @classmethod
-    def analyze(cls):
-        """Full analysis of Chrome installation."""
+    def analyze(cls, full=True, reuse_saved=False):
+        """Full analysis of Chrome installation, optionally reusing the previous run's result."""
+        # Sizes memoized by an earlier call may predate deep changes such as cleared caches
+        _SIZE_CACHE.clear()
+
+        if not reuse_saved:
+            # analyze_data_size has already cached every profile folder, so exact
+            # profile sizes cost nothing extra unless full is turned off
+            return {
+                'data_size': cls.analyze_data_size(),
+                'cache_size': cls.analyze_cache_size(),
+                'last_used': cls.get_last_used(),
+                'profiles': cls.get_profile_info(full=full),
+            }
+
+        cache_file = Path.home() / RESULT_CACHE_PATH
+        key = (full, [(str(path), _folder_mtime(path)) for path in cls.get_watched_folders()])
+
+        saved = None
+        try:
+            cached = pickle.loads(cache_file.read_bytes())
+            if cached['key'] == key and time.time() - cached['saved'] < RESULT_CACHE_MAX_AGE:
+                saved = cached['result']
+        except Exception:
+            # Missing, unreadable or corrupt cache file; recompute below
+            pass
+
+        if saved is None:
+            saved = {
+                'data_size': cls.analyze_data_size(),
+                'last_used': cls.get_last_used(),
+                'profiles': cls.get_profile_info(full=full),
+            }
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file and swap it in so readers never see a partial pickle
+                tmp_file = cache_file.with_suffix('.tmp')
+                tmp_file.write_bytes(
+                    pickle.dumps({'key': key, 'saved': time.time(), 'result': saved})
+                )
+                os.replace(tmp_file, cache_file)
+            except OSError:
+                pass
+
         return {
-            'data_size': cls.analyze_data_size(),
+            'data_size': saved['data_size'],
             'cache_size': cls.analyze_cache_size(),
-            'last_used': cls.get_last_used(),
-            'profiles': cls.get_profile_info(),
+            'last_used': saved['last_used'],
+            'profiles': saved['profiles'],
         }